@@ -57,10 +57,15 @@ def run_test(dispatcher, tolerance=0.4, shots=1000):
 # @params   dispatcher: QuantumDispatcher to run circuits and transmit states
 #           tolerance: max deviation from quantum expectation value allowed
 #           shots: number of shots to run
+#           rounds: number of prepare -> measure -> reset rounds per shot,
+#               each round adds shots samples
 # @returns  Tuple of (pass/fail, test value)
 # @note     Measurements are added to individual circuits to be then
 #               dispatched to respective devices by the dispatcher
-def run_test_parallel(dispatcher,tolerance=0.4,shots=1000):
+def run_test_parallel(dispatcher,tolerance=0.4,shots=1000,rounds=1):
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1, got {}".format(rounds))
+
     # create two bell states across 4 registers
     pre_qc = QuantumCircuit(4)
     pre_qc.append(create_bell_state(),[0,1])
@@ -90,8 +95,8 @@ def run_test_parallel(dispatcher,tolerance=0.4,shots=1000):
     pre_ops = [pre_qc]
     post_ops = [[qc_z,qc_x],[qc_wv]]
     test_val = parse_parallel_data(
-        dispatcher.batch_run_and_transmit(pre_ops,post_ops,shots),
-        shots
+        dispatcher.batch_run_and_transmit(pre_ops,post_ops,shots,rounds),
+        shots*rounds
     )
 
     expectation_value = 2.82842712475 # quantum expectation value
@@ -114,7 +119,7 @@ def parse_parallel_data(counts, shots):
 
     counts_xw = { "00":0, "01":0, "10":0, "11":0 }
     counts_xv = { "00":0, "01":0, "10":0, "11":0 }
-    for key in counts[0]:
+    for key in counts[1]:
         # reverse the key
         key_rev = key[::-1]
         counts_xw[key_rev[0:2]] += counts[1][key]
@@ -2,14 +2,26 @@ from device_independent_test import dimension
 from device_independent_test import entanglement
 from device_independent_test import incompatible_measurement
 from device_independent_test import quantum_communicator
+from device_independent_test import tolerance_table
 
 class HandShake():
     # Object interface between the user and the test modules
     # Stores a dispatcher to send to modules
     # Runs both individual and sets of tests
 
-    def __init__(self, communicator: quantum_communicator.QuantumDispatcher):
+    def __init__(self, communicator: quantum_communicator.QuantumDispatcher,
+            table_path=tolerance_table.DEFAULT_TABLE_PATH):
         self.dispatcher = communicator
+        self.table_path = table_path
+
+    # Look up the fewest shots and matching tolerance for each test such that
+    # false-pass and false-fail rates are both at most 1 - confidence
+    # Returns a params dictionary accepted by test_all
+    def params_for_confidence(self, confidence):
+        params = {}
+        for test in ["dimensionality", "measurement_incompatibility", "entanglement"]:
+            params[test] = tolerance_table.lookup(test, confidence, self.table_path)
+        return params
 
     # Run dimenionality test
     def dimensionality(self, tolerance, shots):
@@ -21,9 +33,12 @@ class HandShake():
         return (passed, value)
 
     # Run measurement incompatibility test
-    def measurement_incompatibility(self, tolerance, shots, parallel=1):
+    # rounds > 1 repeats the parallel test within each shot (see LocalDispatcher)
+    def measurement_incompatibility(self, tolerance, shots, parallel=1, rounds=1):
         if parallel:
-            (passed,value) = incompatible_measurement.run_test_parallel(self.dispatcher, tolerance, shots)
+            (passed,value) = incompatible_measurement.run_test_parallel(self.dispatcher, tolerance, shots, rounds)
+        elif rounds > 1:
+            raise ValueError("rounds > 1 requires the parallel test")
         else:
             (passed,value) = incompatible_measurement.run_test(self.dispatcher, tolerance, shots)
         if passed:
@@ -33,9 +48,12 @@ class HandShake():
         return (passed, value)
 
     # Run entanglement test
-    def entanglement(self, tolerance, shots, parallel=1):
+    # rounds > 1 repeats the parallel test within each shot (see LocalDispatcher)
+    def entanglement(self, tolerance, shots, parallel=1, rounds=1):
         if parallel:
-            (passed, value) = entanglement.run_test_parallel(self.dispatcher, tolerance, shots)
+            (passed, value) = entanglement.run_test_parallel(self.dispatcher, tolerance, shots, rounds)
+        elif rounds > 1:
+            raise ValueError("rounds > 1 requires the parallel test")
         else:
             (passed, value) = entanglement.run_test(self.dispatcher, tolerance, shots)
         if passed:
@@ -47,7 +65,14 @@ class HandShake():
     # Run all tests to verify functioning computer/connection
     # params should look like:
     # { "dimensionality": { "tolerance": 0.1, "shots": 1000 } }
-    def test_all(self, params):
+    # Alternatively pass a target confidence, e.g. test_all(confidence=0.99),
+    # to use precomputed parameters from the tolerance table
+    def test_all(self, params=None, confidence=None):
+        if (params is None) == (confidence is None):
+            raise ValueError("test_all requires exactly one of params or confidence")
+        if confidence is not None:
+            params = self.params_for_confidence(confidence)
+
         dimensionality = self.dimensionality(
             params["dimensionality"]["tolerance"],
             params["dimensionality"]["shots"]
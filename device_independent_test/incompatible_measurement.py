@@ -49,10 +49,15 @@ def run_test(dispatcher, tolerance, shots):
 #           tolerance: tolerance on how close to classical results
 #               the violation can get
 #           shots: number of shots to run
+#           rounds: number of prepare -> measure -> reset rounds per shot,
+#               each round adds shots samples
 # @returns  Pass/Fail and the bell violation value
 #  @note    measure_all() cannot be used in the circuit construction
 #               as it would add classical registers
-def run_test_parallel(dispatcher, tolerance, shots):
+def run_test_parallel(dispatcher, tolerance, shots, rounds=1):
+    if rounds < 1:
+        raise ValueError("rounds must be at least 1, got {}".format(rounds))
+
     measure_0 = QuantumCircuit(4,4)
     for i in range(0,4):
         measure_0.append(measure_circuit(0),[i])
@@ -69,10 +74,10 @@ def run_test_parallel(dispatcher, tolerance, shots):
 
     # send to dispatcher to run
     counts = dispatcher.batch_run_and_transmit(
-                pre_ops,post_ops,shots)
+                pre_ops,post_ops,shots,rounds)
 
     # parse and calculate bell violation
-    violation = bell_violation(counts[0],counts[1],shots,shots)
+    violation = bell_violation(counts[0],counts[1],shots*rounds,shots*rounds)
     expectation_value = 6.82842712475
 
     return (abs(violation-expectation_value) <= tolerance,violation)
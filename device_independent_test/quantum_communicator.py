@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from qiskit import QuantumCircuit, execute
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, Aer, execute, transpile, assemble
+from qiskit.exceptions import QiskitError
+
+# Gates simulated by the stabilizer method, circuits unrollable to these are Clifford
+CLIFFORD_BASIS = ["id", "x", "y", "z", "h", "s", "sdg", "cx", "cz", "swap"]
 
 class QuantumDispatcher(ABC):
     # Abstract base class to define the functionality of a
@@ -26,18 +30,20 @@ class QuantumDispatcher(ABC):
     #           post_operations: multidimensional array of operations to run after transmission
     #                            each column is an pair of operations to run
     #                            each element in the array is a list of operations for a single device
+    #           rounds: number of prepare -> measure -> reset rounds per shot
     # @Returns  Counts from running on all devices
     @abstractmethod
-    def multi_run_and_transmit(self,pre_operations,post_operations,shot):
+    def multi_run_and_transmit(self,pre_operations,post_operations,shot,rounds=1):
         pass
 
     # @brief    Abstract method of running all combinations of pre and post operations
     #           Runs all permutations of input operations, and output operations (permutes over all columns)
     # @params   pre_operations: array of all different operations to run before transmission
     #           post_operations: multidimensional array of all operations to run after transmission
+    #           rounds: number of prepare -> measure -> reset rounds per shot
     # @return   Counts from running on all devices
     @abstractmethod
-    def batch_run_and_transmit(self,pre_operations,post_operations,shot):
+    def batch_run_and_transmit(self,pre_operations,post_operations,shot,rounds=1):
         pass
 
 class LocalDispatcher(QuantumDispatcher):
@@ -62,29 +68,50 @@ class LocalDispatcher(QuantumDispatcher):
         qc += post_operations[0] + post_operations[1]
 
         # run circuit on backend
-        job = execute(qc, backend=self.devices[0], shots=shots)
+        counts = self.run_circuits([qc], shots)[0]
 
-        if job.result().data(qc) == {}:
+        if "NO MEASUREMENT" in counts:
             return {"NO_MEASUREMENT": 0}
 
-        return job.result().get_counts(qc)
+        return counts
 
     # @brief    Method for running multiple circuits
     # @params   pre_operations: array of operations to run before transmision
     #           post_operations: multidimensional array of operations to run after transmission
     #                            each column is an pair of operations to run
     #                            each element in the array is a list of operations for a single device
+    #           rounds: number of prepare -> measure -> reset rounds per shot
     # @Returns  Counts from running on all devices
-    def multi_run_and_transmit(self, pre_operations, post_operations, shots):
+    # @note     When rounds > 1 the counts of all rounds are merged, so each
+    #               circuit reports shots*rounds outcomes
+    def multi_run_and_transmit(self, pre_operations, post_operations, shots, rounds=1):
+        if rounds < 1:
+            raise ValueError("rounds must be at least 1, got {}".format(rounds))
+
         # compose circuits from the input operations
         circuits = []
         for i in range (0,len(pre_operations)):
+            if rounds > 1:
+                circuits.append(compose_rounds(pre_operations[i],
+                    [post_operations[0][i], post_operations[1][i]], rounds))
+                continue
+
             qc = QuantumCircuit(max(post_operations[0][i].num_qubits,
                 post_operations[1][i].num_qubits))
             qc += pre_operations[i]
             qc += post_operations[0][i] + post_operations[1][i]
             circuits.append(qc)
 
+        counts = self.run_circuits(circuits, shots)
+        if rounds > 1:
+            counts = [c if "NO MEASUREMENT" in c else demultiplex_counts(c) for c in counts]
+        return counts
+
+    # @brief    Runs composed circuits on the backend
+    # @params   circuits: list of QuantumCircuits to run
+    #           shots: number of shots to run
+    # @returns  list of counts, "NO MEASUREMENT" dictionary for circuits without counts
+    def run_circuits(self, circuits, shots):
         # run circuit on backend
         job_set = execute(circuits, backend=self.devices[0], shots=shots)
 
@@ -101,8 +128,9 @@ class LocalDispatcher(QuantumDispatcher):
     #           Runs all permutations of input operations, and output operations (permutes over all columns)
     # @params   pre_operations: array of all different operations to run before transmission
     #           post_operations: multidimensional array of all operations to run after transmission
+    #           rounds: number of prepare -> measure -> reset rounds per shot
     # @return   Counts from running on all devices
-    def batch_run_and_transmit(self, pre_operations, post_operations, shots):
+    def batch_run_and_transmit(self, pre_operations, post_operations, shots, rounds=1):
         pre_ops = []
         post_ops = [[],[]]
 
@@ -114,4 +142,102 @@ class LocalDispatcher(QuantumDispatcher):
                     post_ops[0].append(post_op1)
                     post_ops[1].append(post_op2)
 
-        return self.multi_run_and_transmit(pre_ops,post_ops,shots)
+        return self.multi_run_and_transmit(pre_ops,post_ops,shots,rounds)
+
+class StabilizerDispatcher(LocalDispatcher):
+    # Concrete derived class from LocalDispatcher
+    # Clifford-only circuits are simulated with a stabilizer tableau, which
+    #   scales polynomially in the number of qubits, all other circuits
+    #   run on the given backend
+    # Both single and batch dispatches are accelerated as they share run_circuits
+    # Note that the fast path is an ideal simulation, so only use this
+    #   dispatcher in place of a simulator backend
+
+    def __init__(self, backend, stabilizer_backend=None):
+        super().__init__(backend)
+        if stabilizer_backend is None:
+            stabilizer_backend = Aer.get_backend("qasm_simulator")
+        self.stabilizer_backend = stabilizer_backend
+
+    # @brief    Runs Clifford circuits on the stabilizer simulator and the
+    #               remaining circuits on the backend
+    # @params   circuits: list of QuantumCircuits to run
+    #           shots: number of shots to run
+    # @returns  list of counts in the order of circuits
+    def run_circuits(self, circuits, shots):
+        counts = [None]*len(circuits)
+
+        clifford_ids = []
+        clifford_circuits = []
+        for i in range (0,len(circuits)):
+            clifford_qc = to_clifford_circuit(circuits[i])
+            if clifford_qc is not None:
+                clifford_ids.append(i)
+                clifford_circuits.append(clifford_qc)
+
+        # circuits are already unrolled, assembling directly skips the
+        #   transpiler's qubit limit for the statevector simulator
+        if clifford_circuits != []:
+            qobj = assemble(clifford_circuits, shots=shots)
+            result = self.stabilizer_backend.run(qobj,
+                backend_options={"method": "stabilizer"}).result()
+            for i, qc in zip(clifford_ids, clifford_circuits):
+                if result.data(qc) != {}:
+                    counts[i] = result.get_counts(qc)
+                else:
+                    counts[i] = {"NO MEASUREMENT":0}
+
+        # fall back to the backend for non-Clifford circuits
+        other_ids = [i for i in range (0,len(circuits)) if counts[i] is None]
+        if other_ids != []:
+            other_counts = super().run_circuits([circuits[i] for i in other_ids], shots)
+            for i, c in zip(other_ids, other_counts):
+                counts[i] = c
+
+        return counts
+
+# @brief    Unrolls a circuit into Clifford gates
+# @params   circuit: QuantumCircuit to unroll
+# @returns  Equivalent QuantumCircuit over CLIFFORD_BASIS, measure and reset,
+#               or None if the circuit contains non-Clifford gates
+# @note     Gates such as t or u3 cannot be unrolled into the Clifford basis,
+#               so the circuit is treated as non-Clifford
+def to_clifford_circuit(circuit):
+    try:
+        return transpile(circuit, basis_gates=CLIFFORD_BASIS, optimization_level=0)
+    except QiskitError:
+        return None
+
+# @brief    Composes a circuit repeating an operation several times in a single shot
+# @params   pre_operation: operation to run before transmission
+#           post_operations: list of operations to run after transmission
+#           rounds: number of times to repeat the operations
+# @returns  QuantumCircuit with one classical register per round
+# @note     All qubits are reset between rounds so that each round starts
+#               from a freshly initialized register
+def compose_rounds(pre_operation, post_operations, rounds):
+    num_qubits = max(op.num_qubits for op in post_operations)
+    num_clbits = max(op.num_clbits for op in post_operations)
+
+    qr = QuantumRegister(num_qubits, "q")
+    cregs = [ClassicalRegister(num_clbits, "round" + str(r)) for r in range(0,rounds)]
+    qc = QuantumCircuit(qr, *cregs)
+
+    for r in range(0,rounds):
+        qc.append(pre_operation, qr[0:pre_operation.num_qubits])
+        for op in post_operations:
+            qc.append(op, qr[0:op.num_qubits], cregs[r][0:op.num_clbits])
+        if r < rounds - 1:
+            qc.reset(qr)
+
+    return qc
+
+# @brief    Merges the counts of a multi-round circuit into standard counts
+# @params   counts: dictionary of counts with one space separated bitstring per round
+# @returns  dictionary of counts over a single round, totaling shots*rounds
+def demultiplex_counts(counts):
+    merged = {}
+    for key in counts:
+        for round_key in key.split(" "):
+            merged[round_key] = merged.get(round_key, 0) + counts[key]
+    return merged
@@ -0,0 +1,238 @@
+import os
+import json
+import math
+import argparse
+from functools import lru_cache
+
+# Default location of the precomputed table shipped with the module
+DEFAULT_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tolerance_table.json")
+
+# Noise level used to build the default table
+DEFAULT_NOISE = 0.05
+
+# Target false-pass/false-fail rates tabulated by default
+DEFAULT_RATES = [0.1, 0.05, 0.01, 1e-3, 1e-4, 1e-6]
+
+# Upper limit on shots considered when searching for parameters
+MAX_SHOTS = 10**6
+
+# Statistics of each test in the handshake
+#   ideal: noiseless quantum value, tests pass when within tolerance of it
+#   local_bound: best value achievable by a device failing the test
+#   uniform: value obtained from a completely depolarized device
+#   trials: number of binary outcomes scored per shot
+#   offset/scale: the test value is offset + scale*k/(trials*shots) where k
+#       counts the outcomes contributing positively to the score
+TESTS = {
+    "dimensionality": {
+        "ideal": 1.0,
+        "local_bound": 0.5,
+        "uniform": 0.25,
+        "trials": 4,
+        "offset": 0.0,
+        "scale": 1.0
+    },
+    "measurement_incompatibility": {
+        "ideal": 6.82842712475,
+        "local_bound": 6.0,
+        "uniform": 4.0,
+        "trials": 8,
+        "offset": 0.0,
+        "scale": 8.0
+    },
+    "entanglement": {
+        "ideal": 2.82842712475,
+        "local_bound": 2.0,
+        "uniform": 0.0,
+        "trials": 4,
+        "offset": -4.0,
+        "scale": 8.0
+    }
+}
+
+# @brief    Expected test value for a device subject to white noise
+# @params   test: name of the test, a key of TESTS
+#           noise: probability in [0,1] that the device fully depolarizes
+# @returns  float expected test value
+def noisy_mean(test, noise):
+    stats = TESTS[test]
+    return stats["uniform"] + (1 - noise)*(stats["ideal"] - stats["uniform"])
+
+# @brief    Probability that a binomial random variable lies in [low, high]
+# @params   trials: number of binomial trials
+#           prob: success probability of each trial
+#           low/high: inclusive bounds on the number of successes
+# @note     sums outward from the point of the window nearest the mode and
+#               stops once the remaining terms are negligible
+def _binomial_window(trials, prob, low, high):
+    low = max(low, 0)
+    high = min(high, trials)
+    if low > high:
+        return 0.0
+    if prob <= 0:
+        return 1.0 if low == 0 else 0.0
+    if prob >= 1:
+        return 1.0 if high == trials else 0.0
+
+    start = min(max(int((trials + 1)*prob), low), high)
+    pmf = math.exp(
+        math.lgamma(trials + 1) - math.lgamma(start + 1) - math.lgamma(trials - start + 1)
+        + start*math.log(prob) + (trials - start)*math.log(1 - prob)
+    )
+    odds = prob/(1 - prob)
+
+    total = pmf
+    term = pmf
+    for k in range(start + 1, high + 1):
+        term *= odds*(trials - k + 1)/k
+        total += term
+        if term < 1e-17*total:
+            break
+    term = pmf
+    for k in range(start - 1, low - 1, -1):
+        term *= (k + 1)/((trials - k)*odds)
+        total += term
+        if term < 1e-17*total:
+            break
+
+    return min(total, 1.0)
+
+# @brief    Probability that the test value lies within tolerance of the ideal value
+# @params   test: name of the test, a key of TESTS
+#           mean: expected test value of the device
+#           tolerance: max deviation from the ideal value allowed
+#           shots: number of shots to run
+def _pass_rate(test, mean, tolerance, shots):
+    stats = TESTS[test]
+    trials = stats["trials"]*shots
+    prob = (mean - stats["offset"])/stats["scale"]
+
+    # convert the passing interval on the test value into one on the count
+    low = math.ceil(trials*(stats["ideal"] - tolerance - stats["offset"])/stats["scale"])
+    high = math.floor(trials*(stats["ideal"] + tolerance - stats["offset"])/stats["scale"])
+
+    return _binomial_window(trials, prob, low, high)
+
+# @brief    Probability that a device subject to the noise model fails the test
+# @params   test: name of the test, a key of TESTS
+#           noise: white noise level of the device
+#           tolerance: max deviation from the ideal value allowed
+#           shots: number of shots to run
+# @returns  float false-fail rate
+def false_fail_rate(test, noise, tolerance, shots):
+    return 1 - _pass_rate(test, noisy_mean(test, noise), tolerance, shots)
+
+# @brief    Probability that a device saturating the local bound passes the test
+# @params   test: name of the test, a key of TESTS
+#           tolerance: max deviation from the ideal value allowed
+#           shots: number of shots to run
+# @returns  float false-pass rate
+def false_pass_rate(test, tolerance, shots):
+    return _pass_rate(test, TESTS[test]["local_bound"], tolerance, shots)
+
+# @brief    Smallest tolerance meeting the false-fail rate at a fixed number of shots
+# @returns  tolerance, or None if no tolerance below the ideal/local gap suffices
+# @note     the result is padded by half a step of the test value so that
+#               floating point rounding cannot change the verdict
+def _minimal_tolerance(test, noise, false_fail, shots):
+    gap = TESTS[test]["ideal"] - TESTS[test]["local_bound"]
+    if false_fail_rate(test, noise, gap, shots) > false_fail:
+        return None
+
+    low, high = 0.0, gap
+    for _ in range(60):
+        mid = (low + high)/2
+        if false_fail_rate(test, noise, mid, shots) <= false_fail:
+            high = mid
+        else:
+            low = mid
+    return high + TESTS[test]["scale"]/(2*TESTS[test]["trials"]*shots)
+
+# @brief    Tolerance meeting both rates at a fixed number of shots
+# @returns  tolerance, or None if the rates cannot be met
+def _feasible_tolerance(test, noise, false_pass, false_fail, shots):
+    tolerance = _minimal_tolerance(test, noise, false_fail, shots)
+    if tolerance is None or false_pass_rate(test, tolerance, shots) > false_pass:
+        return None
+    return tolerance
+
+# @brief    Finds the fewest shots and the matching tolerance for a test
+# @params   test: name of the test, a key of TESTS
+#           noise: white noise level of an honest device
+#           false_pass: max probability a device at the local bound passes
+#           false_fail: max probability an honest device fails
+#           max_shots: upper limit on the number of shots searched
+# @returns  Tuple of (tolerance, shots)
+# @note     raises ValueError if the rates cannot be met within max_shots
+def minimal_parameters(test, noise, false_pass, false_fail, max_shots=MAX_SHOTS):
+    if noisy_mean(test, noise) <= TESTS[test]["local_bound"]:
+        raise ValueError("noise {} leaves no separation from the local bound for {}".format(noise, test))
+
+    # the rates are not monotone in shots for discrete counts, so take the
+    # first feasible number of shots rather than bisecting
+    for shots in range(1, max_shots + 1):
+        tolerance = _feasible_tolerance(test, noise, false_pass, false_fail, shots)
+        if tolerance is not None:
+            return (tolerance, shots)
+
+    raise ValueError("{} cannot meet the target rates within {} shots".format(test, max_shots))
+
+# @brief    Precomputes minimal parameters for every test and pair of target rates
+# @params   noise: white noise level of an honest device
+#           rates: list of target rates, used for both false-pass and false-fail
+# @returns  dictionary with the noise level and a list of entries for each test
+def build_table(noise=DEFAULT_NOISE, rates=DEFAULT_RATES):
+    table = {"noise": noise, "tests": {}}
+    for test in TESTS:
+        entries = []
+        for false_pass in rates:
+            for false_fail in rates:
+                (tolerance, shots) = minimal_parameters(test, noise, false_pass, false_fail)
+                entries.append({
+                    "false_pass": false_pass,
+                    "false_fail": false_fail,
+                    "tolerance": tolerance,
+                    "shots": shots
+                })
+        table["tests"][test] = entries
+    return table
+
+# @brief    Writes a table to disk as json
+def save_table(table, path=DEFAULT_TABLE_PATH):
+    with open(path, "w") as file:
+        json.dump(table, file, indent=2)
+
+# @brief    Reads a table from disk
+# @note     memoized, so each file is only parsed once per process
+@lru_cache(maxsize=None)
+def load_table(path=DEFAULT_TABLE_PATH):
+    with open(path) as file:
+        return json.load(file)
+
+# @brief    Looks up the cheapest parameters meeting a target confidence
+# @params   test: name of the test, a key of TESTS
+#           confidence: required probability of a correct verdict, both the
+#               false-pass and false-fail rates must be at most 1 - confidence
+#           path: location of the precomputed table
+# @returns  dictionary with "tolerance" and "shots"
+# @note     raises ValueError if no tabulated entry meets the confidence
+def lookup(test, confidence, path=DEFAULT_TABLE_PATH):
+    max_rate = 1 - confidence + 1e-12 # absorb rounding in 1 - confidence
+    entries = [
+        entry for entry in load_table(path)["tests"][test]
+        if entry["false_pass"] <= max_rate and entry["false_fail"] <= max_rate
+    ]
+    if entries == []:
+        raise ValueError("no tabulated parameters for {} at confidence {}".format(test, confidence))
+
+    best = min(entries, key=lambda entry: entry["shots"])
+    return {"tolerance": best["tolerance"], "shots": best["shots"]}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute tolerance/shots tables for the handshake tests.")
+    parser.add_argument("--noise", type=float, default=DEFAULT_NOISE)
+    parser.add_argument("--rates", type=float, nargs="+", default=DEFAULT_RATES)
+    parser.add_argument("--output", default=DEFAULT_TABLE_PATH)
+    args = parser.parse_args()
+
+    save_table(build_table(args.noise, args.rates), args.output)
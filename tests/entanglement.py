@@ -14,4 +14,14 @@ class module_test_cases(unittest.TestCase):
 		self.assertAlmostEqual(test_state.data[0], 1/np.sqrt(2))
 		self.assertAlmostEqual(test_state.data[1], 0)
 		self.assertAlmostEqual(test_state.data[2], 0)
-		self.assertAlmostEqual(test_state.data[3], 1/np.sqrt(2))
\ No newline at end of file
+		self.assertAlmostEqual(test_state.data[3], 1/np.sqrt(2))
+
+	def test_parse_parallel_data(self):
+		# jobs observe different outcomes so their keys differ
+		counts = [{"0000": 10}, {"1111": 10}]
+
+		self.assertAlmostEqual(entanglement.parse_parallel_data(counts, 10), 2)
+
+	def test_run_test_parallel_invalid_rounds(self):
+		with self.assertRaises(ValueError):
+			entanglement.run_test_parallel(None, 0.4, 1000, rounds=0)
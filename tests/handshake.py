@@ -36,3 +36,16 @@ class module_test_cases(unittest.TestCase):
         except:
             print("test_all does not run.")
 
+    def test_test_all_arguments(self):
+        obj = HandShake(None)
+        with self.assertRaises(ValueError):
+            obj.test_all()
+        with self.assertRaises(ValueError):
+            obj.test_all(params={}, confidence=0.99)
+
+    def test_rounds_requires_parallel(self):
+        obj = HandShake(None)
+        with self.assertRaises(ValueError):
+            obj.entanglement(0.2, 1000, parallel=0, rounds=3)
+        with self.assertRaises(ValueError):
+            obj.measurement_incompatibility(0.5, 1000, parallel=0, rounds=3)
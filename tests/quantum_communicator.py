@@ -0,0 +1,114 @@
+import unittest
+from qiskit import QuantumCircuit, Aer
+
+from device_independent_test import dimension
+from device_independent_test import entanglement
+from device_independent_test import incompatible_measurement
+from device_independent_test import quantum_communicator
+
+class FailingBackend():
+    # Fallback backend which fails if any circuit is sent to it
+    def configuration(self):
+        raise AssertionError("circuit was not run on the stabilizer fast path")
+
+    def run(self, *args, **kwargs):
+        raise AssertionError("circuit was not run on the stabilizer fast path")
+
+class module_test_cases(unittest.TestCase):
+    def test_compose_rounds(self):
+        pre_op = QuantumCircuit(2)
+        pre_op.h(0)
+        post_op = QuantumCircuit(2,2)
+        post_op.measure(0,0)
+        post_op.measure(1,1)
+
+        qc = quantum_communicator.compose_rounds(pre_op, [QuantumCircuit(2,2), post_op], 3)
+
+        self.assertEqual(qc.num_qubits, 2)
+        self.assertEqual(len(qc.cregs), 3)
+        self.assertEqual(qc.count_ops()["reset"], 4)
+
+    def test_multi_round_dispatch(self):
+        communicator = quantum_communicator.LocalDispatcher([Aer.get_backend('qasm_simulator')])
+        shots = 1000
+
+        pre_ops = [incompatible_measurement.bb84_states()]
+        measure = QuantumCircuit(4,4)
+        measure.measure(range(0,4),range(0,4))
+        counts = communicator.batch_run_and_transmit(pre_ops, [[QuantumCircuit(4,4)],[measure]], shots, 3)
+
+        self.assertEqual(sum(counts[0].values()), 3*shots)
+
+        (passed, value) = incompatible_measurement.run_test_parallel(communicator, 0.2, shots, rounds=3)
+        (_, single_value) = incompatible_measurement.run_test_parallel(communicator, 0.2, shots)
+
+        self.assertTrue(passed)
+        self.assertAlmostEqual(value, single_value, delta=0.2)
+
+    def test_invalid_rounds(self):
+        communicator = quantum_communicator.LocalDispatcher([Aer.get_backend('qasm_simulator')])
+
+        with self.assertRaises(ValueError):
+            communicator.batch_run_and_transmit([QuantumCircuit(1)], [[QuantumCircuit(1)],[QuantumCircuit(1)]], 10, 0)
+
+    def test_demultiplex_counts(self):
+        counts = {"01 00 11": 5, "00 00 10": 2}
+
+        merged = quantum_communicator.demultiplex_counts(counts)
+
+        self.assertEqual(merged, {"01": 5, "00": 9, "11": 5, "10": 2})
+        self.assertEqual(sum(merged.values()), 21)
+
+    def test_to_clifford_circuit(self):
+        qc = QuantumCircuit(2,2)
+        qc.append(entanglement.create_bell_state(),[0,1])
+        qc.append(entanglement.alice_X(),[0,1],[0,1])
+        qc.measure(0,0)
+
+        self.assertFalse(quantum_communicator.to_clifford_circuit(qc) is None)
+
+        qc.append(entanglement.bob_W(),[0,1],[0,1])
+
+        self.assertTrue(quantum_communicator.to_clifford_circuit(qc) is None)
+
+    def test_stabilizer_dispatcher(self):
+        communicator = quantum_communicator.StabilizerDispatcher([FailingBackend()])
+
+        (passed, value) = dimension.run_test(communicator, 0.1, 100)
+
+        self.assertTrue(passed)
+        self.assertEqual(value, 1.0)
+
+    def test_stabilizer_dispatcher_wide_circuit(self):
+        # 60 qubits is far beyond statevector memory
+        num_qubits = 60
+        bits = [i % 2 for i in range(0,num_qubits)]
+        measure = QuantumCircuit(num_qubits)
+        measure.measure_all()
+        communicator = quantum_communicator.StabilizerDispatcher([FailingBackend()])
+
+        counts = communicator.multi_run_and_transmit(
+            [dimension.prepare_bit_circuit(bits)],
+            [[QuantumCircuit(num_qubits)], [measure]],
+            10
+        )
+
+        self.assertEqual(counts[0], {"".join(str(b) for b in bits[::-1]): 10})
+
+    def test_stabilizer_dispatcher_single_run(self):
+        communicator = quantum_communicator.StabilizerDispatcher([FailingBackend()])
+
+        counts = communicator.run_and_transmit(
+            dimension.prepare_bit_circuit([1,0]), [QuantumCircuit(2), dimension.measure_circuit()], 10)
+
+        self.assertEqual(counts, {"01": 10})
+
+    def test_stabilizer_dispatcher_fallback(self):
+        communicator = quantum_communicator.StabilizerDispatcher([Aer.get_backend('qasm_simulator')])
+        qc = QuantumCircuit(2,2)
+        qc.append(entanglement.bob_W(),[0,1],[0,1])
+        qc.measure(1,1)
+
+        counts = communicator.multi_run_and_transmit([QuantumCircuit(2)], [[QuantumCircuit(2,2)], [qc]], 100)
+
+        self.assertEqual(sum(counts[0].values()), 100)
@@ -0,0 +1,43 @@
+import unittest
+
+from device_independent_test import tolerance_table
+
+class module_test_cases(unittest.TestCase):
+    def test_noisy_mean(self):
+        self.assertAlmostEqual(tolerance_table.noisy_mean("entanglement", 0), 2.82842712475)
+        self.assertAlmostEqual(tolerance_table.noisy_mean("entanglement", 1), 0)
+        self.assertAlmostEqual(tolerance_table.noisy_mean("dimensionality", 0.5), 0.625)
+
+    def test_minimal_parameters(self):
+        for test in tolerance_table.TESTS:
+            (tolerance, shots) = tolerance_table.minimal_parameters(test, 0.05, 0.01, 0.01)
+
+            self.assertTrue(tolerance_table.false_fail_rate(test, 0.05, tolerance, shots) <= 0.01)
+            self.assertTrue(tolerance_table.false_pass_rate(test, tolerance, shots) <= 0.01)
+
+    def test_minimal_parameters_fewest_shots(self):
+        for test in tolerance_table.TESTS:
+            (tolerance, shots) = tolerance_table.minimal_parameters(test, 0.05, 1e-3, 0.1)
+
+            self.assertIsNone(tolerance_table._feasible_tolerance(test, 0.05, 1e-3, 0.1, shots - 1))
+
+    def test_table_fewest_shots(self):
+        table = tolerance_table.load_table()
+        for test in table["tests"]:
+            for entry in table["tests"][test]:
+                self.assertIsNone(tolerance_table._feasible_tolerance(
+                    test, table["noise"], entry["false_pass"], entry["false_fail"], entry["shots"] - 1
+                ))
+
+    def test_minimal_parameters_too_noisy(self):
+        with self.assertRaises(ValueError):
+            tolerance_table.minimal_parameters("entanglement", 0.5, 0.01, 0.01)
+
+    def test_lookup(self):
+        loose = tolerance_table.lookup("measurement_incompatibility", 0.9)
+        strict = tolerance_table.lookup("measurement_incompatibility", 0.999)
+
+        self.assertTrue(loose["shots"] < strict["shots"])
+
+        with self.assertRaises(ValueError):
+            tolerance_table.lookup("measurement_incompatibility", 0.9999999)